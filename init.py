@@ -4,19 +4,26 @@
 
 from __future__ import annotations
 
-import ctypes
 import platform
 import re
+import shlex
 import subprocess as sp
 import sys
-from functools import partial
-from os import chdir, getenv
+from collections.abc import Iterable, Sequence
+from functools import cache, partial
+from io import BufferedReader
+from os import X_OK, access, chdir, getenv, pathsep, scandir
 from pathlib import Path
-from shutil import which
+from queue import Queue
+from threading import Thread
 from time import sleep
+from typing import Final
 
 __version__ = "0.1.0"
 
+_SYSTEM: Final[str] = platform.system()
+_IS_WINDOWS: Final[bool] = _SYSTEM == "Windows"
+
 ROOT_DIR: Path = Path(__file__).parent
 ENV_KEYS: set[str] = {
     "RECAPTCHA_SECRET_KEY",
@@ -25,9 +32,36 @@ ENV_KEYS: set[str] = {
     "ARGON_THREADS",
     "API_URL",
 }
+MKCERT_INSTALL_CMDS: dict[str, list[list[str]]] = {
+    "brew": [["brew", "install", "mkcert"]],
+    "choco": [["choco", "install", "mkcert", "-y"]],
+    "scoop": [["scoop", "install", "mkcert"]],
+    "apt": [["sudo", "apt", "update"], ["sudo", "apt", "install", "-y", "mkcert"]],
+    "dnf": [["sudo", "dnf", "install", "-y", "mkcert"]],
+    "pacman": [["sudo", "pacman", "-S", "mkcert"]],
+}
+TOOLS: tuple[str, ...] = (*MKCERT_INSTALL_CMDS, "mkcert", "node", "npm")
+
+_BACKTICK_RE = re.compile(r"`([^`]*)`")
+_LINE_END_RE = re.compile(rb"\r\n|\r|\n")
+_ENV_ENTRY_RE = re.compile(r"^(?!#)[ \t]*([^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+_ENV_INVALID_RE = re.compile(r"^(?!#)(?=[^\n]*\S)[^=\n]*$", re.MULTILINE)
+
+# Banner with color markers (B: blue, D: dim, R: reset), expanded by `pbanner`
+_BANNER_TMPL = """
+
+    B▄▄▄▄R   B▄▄▄▄R                                D▄▄R D▄▄R      B▄▄R
+  B██▀▀▀▀█R  B▀▀██R                                D█B█R B██R      B██R
+ B██▀R         R██R       R▄█D███▄R   D██R    D██R   B▄███▄██R B▀█▄R B██R B▄█▀R  B▄████▄R    R██▄████R  R▀██R  R██D▀R
+ R██R          R██R      D██▀R  D▀██R  D█B█R    B██R  B██▀R  B▀█B█R  B██R B██R B██R  B██▀R  R▀██R   R██▀R        D████R
+ R██▄R         D██R      D██R    B██R  B██R    B██R  B██R    B██R  B███▀▀R███R  R██R    R██R   D██R         D▄██▄R
+  D██▄▄▄▄█R    D██▄B▄▄R   B▀██▄▄██▀R  B█B█▄▄▄███R  B▀██▄▄██R█R  R███R  R███R  R▀██D▄▄██▀R   D██R        B▄█▀▀█▄R
+    D▀▀▀▀R      B▀▀▀▀R     B▀B▀▀▀R     B▀▀▀▀R B▀▀R    R▀▀▀R R▀▀R  R▀▀▀R  D▀▀▀R    D▀▀▀▀R     B▀▀R       B▀▀▀R  B▀▀B▀R
 
+"""
 
-class Color:
+
+class _AnsiColors:
     RED = "\033[91m"
     GRN = "\033[92m"
     YLW = "\033[93m"
@@ -38,26 +72,32 @@ class Color:
     BLD = "\033[1m"
     RST = "\033[0m"
 
-    @staticmethod
-    def _strip_colors() -> None:
-        """Strip ANSI codes for platforms not supporting them"""
 
-        if platform.system() == "Windows" and not getenv("ANSICON"):
-            for attr in dir(Color):
-                if not attr.startswith("_") and attr != "strip_colors":
-                    setattr(Color, attr, "")
+class _NoColors(_AnsiColors):
+    """Palette for terminals without ANSI support"""
+
+    RED = GRN = YLW = BLU = MAG = CYN = DIM = BLD = RST = ""
+
+
+# Active palette (selected once by `check_platform`)
+C: type[_AnsiColors] = _AnsiColors
 
-    @staticmethod
-    def check_platform() -> None:
-        """Initialize color settings based on platform"""
 
-        if platform.system() == "Windows":
-            # Enable ANSI colors on Windows 10+
-            try:
-                kernel32 = ctypes.windll.kernel32
-                kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
-            except Exception:  # noqa: BLE001
-                Color._strip_colors()
+def check_platform() -> None:
+    """Select the color palette based on platform"""
+
+    global C  # noqa: PLW0603
+
+    if _IS_WINDOWS:
+        # Enable ANSI colors on Windows 10+
+        try:
+            import ctypes  # noqa: PLC0415
+
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
+        except Exception:  # noqa: BLE001
+            if not getenv("ANSICON"):
+                C = _NoColors
 
 
 def _print(
@@ -68,10 +108,11 @@ def _print(
     color: str,
     end: str = "\n",
 ) -> None:
-    """Print message with optional indentation and color"""
+    """Print message with optional indentation and color (name of a palette attribute)"""
 
-    if color != Color.DIM:
-        msg = re.sub(r"`(.*?)`", rf"{Color.RST}`\1`{color}", msg)
+    code = getattr(C, color)
+    if C is _AnsiColors and color != "DIM" and "`" in msg:
+        msg = _BACKTICK_RE.sub(lambda m: f"{C.RST}`{m.group(1)}`{code}", msg)
 
     if prefix is None:
         prefix = ""
@@ -79,134 +120,184 @@ def _print(
         prefix += " "
 
     padding = " " * indent
-    print(f"{padding}{color}{prefix}{msg}{Color.RST}", end=end, flush=True)
+    print(f"{padding}{code}{prefix}{msg}{C.RST}", end=end, flush=True)
 
 
 def pwindows_tip() -> None:
     _print(
         r'Start-Process wt.exe -Verb RunAs -ArgumentList "python $PWD\init.py"',
         indent=4,
-        color=Color.DIM,
+        color="DIM",
     )
 
 
 def psec(title: str) -> None:
     """Print section header"""
-    print(f"\n{Color.BLD}[{title}]{Color.RST}")
+    print(f"\n{C.BLD}[{title}]{C.RST}")
 
 
 def pbanner() -> None:
     """Display the CloudWorx banner"""
-    banner = (
-        f"\n\n    {Color.BLU}▄▄▄▄{Color.RST}   {Color.BLU}▄▄▄▄{Color.RST}                                {Color.DIM}"
-        f"▄▄{Color.RST} {Color.DIM}▄▄{Color.RST}      {Color.BLU}▄▄{Color.RST}\n"
-        f"  {Color.BLU}██▀▀▀▀█{Color.RST}  {Color.BLU}▀▀██{Color.RST}                                {Color.DIM}█"
-        f"{Color.BLU}█{Color.RST} {Color.BLU}██{Color.RST}      {Color.BLU}██{Color.RST}\n"
-        f" {Color.BLU}██▀{Color.RST}         {Color.RST}██{Color.RST}       {Color.RST}▄█{Color.DIM}███▄{Color.RST}   "
-        f"{Color.DIM}██{Color.RST}    {Color.DIM}██{Color.RST}   {Color.BLU}▄███▄██{Color.RST} {Color.BLU}▀█▄"
-        f"{Color.RST} {Color.BLU}██{Color.RST} {Color.BLU}▄█▀{Color.RST}  {Color.BLU}▄████▄{Color.RST}    {Color.RST}"
-        f"██▄████{Color.RST}  {Color.RST}▀██{Color.RST}  {Color.RST}██{Color.DIM}▀{Color.RST}\n"
-        f" {Color.RST}██{Color.RST}          {Color.RST}██{Color.RST}      {Color.DIM}██▀{Color.RST}  {Color.DIM}▀██"
-        f"{Color.RST}  {Color.DIM}█{Color.BLU}█{Color.RST}    {Color.BLU}██{Color.RST}  {Color.BLU}██▀{Color.RST}  "
-        f"{Color.BLU}▀█{Color.BLU}█{Color.RST}  {Color.BLU}██{Color.RST} {Color.BLU}██{Color.RST} {Color.BLU}██"
-        f"{Color.RST}  {Color.BLU}██▀{Color.RST}  {Color.RST}▀██{Color.RST}   {Color.RST}██▀{Color.RST}        "
-        f"{Color.DIM}████{Color.RST}\n {Color.RST}██▄{Color.RST}         {Color.DIM}██{Color.RST}      {Color.DIM}"
-        f"██{Color.RST}    {Color.BLU}██{Color.RST}  {Color.BLU}██{Color.RST}    {Color.BLU}██{Color.RST}  {Color.BLU}"
-        f"██{Color.RST}    {Color.BLU}██{Color.RST}  {Color.BLU}███▀▀{Color.RST}███{Color.RST}  {Color.RST}██"
-        f"{Color.RST}    {Color.RST}██{Color.RST}   {Color.DIM}██{Color.RST}         {Color.DIM}▄██▄{Color.RST}\n"
-        f"  {Color.DIM}██▄▄▄▄█{Color.RST}    {Color.DIM}██▄{Color.BLU}▄▄{Color.RST}   {Color.BLU}▀██▄▄██▀{Color.RST}  "
-        f"{Color.BLU}█{Color.BLU}█▄▄▄███{Color.RST}  {Color.BLU}▀██▄▄██{Color.RST}█{Color.RST}  {Color.RST}███"
-        f"{Color.RST}  {Color.RST}███{Color.RST}  {Color.RST}▀██{Color.DIM}▄▄██▀{Color.RST}   {Color.DIM}██"
-        f"{Color.RST}        {Color.BLU}▄█▀▀█▄{Color.RST}\n    {Color.DIM}▀▀▀▀{Color.RST}      {Color.BLU}▀▀▀▀"
-        f"{Color.RST}     {Color.BLU}▀{Color.BLU}▀▀▀{Color.RST}     {Color.BLU}▀▀▀▀{Color.RST} {Color.BLU}"
-        f"▀▀{Color.RST}    {Color.RST}▀▀▀{Color.RST} {Color.RST}▀▀{Color.RST}  {Color.RST}▀▀▀{Color.RST}  "
-        f"{Color.DIM}▀▀▀{Color.RST}    {Color.DIM}▀▀▀▀{Color.RST}     {Color.BLU}▀▀{Color.RST}       "
-        f"{Color.BLU}▀▀▀{Color.RST}  {Color.BLU}▀▀{Color.BLU}▀{Color.RST}\n\n"
-    )
 
-    for line in banner.splitlines():
-        sleep(0.025)
-        print(line, flush=True)
+    # Palette is built per call since `C` is only selected at startup
+    banner = _BANNER_TMPL.translate(str.maketrans({"B": C.BLU, "D": C.DIM, "R": C.RST}))
 
+    if getenv("CLOUDWORX_ANIMATE") != "1":
+        sys.stdout.write(banner)
+        sys.stdout.flush()
+        return
 
-psuccess = partial(_print, prefix="✓", color=Color.GRN)
-pwarn = partial(_print, prefix="!", color=Color.YLW)
-perr = partial(_print, prefix="✗", color=Color.RED)
-pinfo = partial(_print, prefix="→", color=Color.BLU)
+    # Typewriter effect; written via `sys.stdout` so Windows consoles get proper Unicode output
+    ansi = C is _AnsiColors
+    if ansi:
+        sys.stdout.write("\033[?25l")
+    try:
+        for line in banner.splitlines(keepends=True):
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            sleep(0.025)
+    finally:
+        if ansi:
+            sys.stdout.write("\033[?25h")
+            sys.stdout.flush()
+
+
+psuccess = partial(_print, prefix="✓", color="GRN")
+pwarn = partial(_print, prefix="!", color="YLW")
+perr = partial(_print, prefix="✗", color="RED")
+pinfo = partial(_print, prefix="→", color="BLU")
 
 
 def is_admin() -> bool:
     """Check if the script is running with administrator privileges on Windows"""
     try:
+        import ctypes  # noqa: PLC0415
+
         return ctypes.windll.shell32.IsUserAnAdmin()
     except Exception:  # noqa: BLE001
         return False
 
 
+def probe_tools(names: Iterable[str]) -> dict[str, str | None]:
+    """Locate several executables with a single pass over `PATH`"""
+
+    found: dict[str, str | None] = dict.fromkeys(names)
+
+    if _IS_WINDOWS:
+        exts = [ext.lower() for ext in getenv("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(";") if ext]
+        lookup = {f"{name}{ext}".lower(): name for name in found for ext in exts}
+        fold = str.lower
+    else:
+        lookup = {name: name for name in found}
+        fold = str
+
+    remaining = len(found)
+    for path_dir in getenv("PATH", "").split(pathsep):
+        if not path_dir:
+            continue
+        try:
+            with scandir(path_dir) as entries:
+                for entry in entries:
+                    name = lookup.get(fold(entry.name))
+                    if name is None or found[name] is not None:
+                        continue
+                    if entry.is_file() and access(entry.path, X_OK):
+                        found[name] = entry.path
+                        remaining -= 1
+        except OSError:
+            continue
+        if not remaining:
+            break
+
+    return found
+
+
+@cache
+def tool_paths() -> dict[str, str | None]:
+    """Paths of all tools used by this script (scanned once)"""
+    return probe_tools(TOOLS)
+
+
 def yn_prompt(prompt: str, indent: int = 0) -> bool:
     """Ask user y/n question"""
 
     padding = " " * indent
-    ans = input(f"{padding}{prompt} (y/n): ")
-    return ans.lower().strip() == "y"
+    if not _IS_WINDOWS:
+        ans = input(f"{padding}{prompt} (y/n): ")
+        return ans.lower().strip() == "y"
+
+    # Read a single keypress on Windows (no Enter needed)
+    import msvcrt  # noqa: PLC0415
+
+    print(f"{padding}{prompt} (y/n): ", end="", flush=True)
+    ans = msvcrt.getwch()
+    print(ans)
+    return ans.lower() == "y"
+
+
+def _pump(pipe: BufferedReader, lines: Queue[tuple[str, str] | None]) -> None:
+    """Forward `(line, ending)` pairs from a pipe to a queue, followed by `None` on EOF"""
+
+    buf = b""
+    with pipe:
+        while chunk := pipe.read1(8192):
+            buf += chunk
+            # Hold back a trailing `\r` in case the next chunk starts with `\n`
+            limit = len(buf) - 1 if buf.endswith(b"\r") else len(buf)
+            start = 0
+            for m in _LINE_END_RE.finditer(buf, 0, limit):
+                lines.put((buf[start : m.start()].decode("utf-8", "replace"), "\r" if m[0] == b"\r" else "\n"))
+                start = m.end()
+            buf = buf[start:]
+    if buf:
+        lines.put((buf.decode("utf-8", "replace"), "\r" if buf.endswith(b"\r") else "\n"))
+    lines.put(None)
 
 
-def run_cmd(cmd: str, *, indent: int = 0, output: bool = True) -> bool:  # noqa: C901, PLR0912
-    """Run a shell command with or without its output. Returns True on success, False on failure."""
+def run_cmd(cmd: str | Sequence[str], *, indent: int = 0, output: bool = True) -> bool:
+    """Run a command with or without its output. Returns True on success, False on failure."""
+
+    args = shlex.split(cmd, posix=not _IS_WINDOWS) if isinstance(cmd, str) else list(cmd)
+    # Use the resolved path so Windows `.cmd` shims (e.g. npm) run without a shell
+    args[0] = tool_paths().get(args[0]) or args[0]
 
     try:
-        process = sp.Popen(  # noqa: S602
-            cmd,
-            shell=True,
+        process = sp.Popen(  # noqa: S603
+            args,
             stdout=sp.PIPE if output else None,
             stderr=sp.PIPE if output else None,
             stdin=sys.stdin,
-            text=True,
-            encoding="utf-8",
         )
 
         if output:
-            printed = False
-            starts_w_progress = False
-
-            if process.stdout is not None:
-                for line in process.stdout:
-                    if line := line.strip():
-                        printed = True
-                        if line.startswith("Progress"):
-                            starts_w_progress = True
-                        elif starts_w_progress:
-                            starts_w_progress = False
-                            print()
-                        _print(
-                            f" | {line}",
-                            indent=indent,
-                            color=Color.DIM,
-                            end="\r" if starts_w_progress else "\n",
-                        )
+            # Drain both pipes concurrently so neither can fill up and block the child
+            lines: Queue[tuple[str, str] | None] = Queue()
+            pipes = [pipe for pipe in (process.stdout, process.stderr) if pipe is not None]
+            for pipe in pipes:
+                Thread(target=_pump, args=(pipe, lines), daemon=True).start()
+
+            # Lines ending in `\r` (progress updates) are overwritten in place by the next line
+            overwrite_len = 0
+            open_pipes = len(pipes)
+            while open_pipes:
+                item = lines.get()
+                if item is None:
+                    open_pipes -= 1
+                elif line := item[0].strip():
+                    line, end = f" | {line}", item[1]
+                    _print(line.ljust(overwrite_len), indent=indent, color="DIM", end=end)
+                    overwrite_len = len(line) if end == "\r" else 0
+
+            if overwrite_len:
+                print()
 
             return_code = process.wait()
-
-            if not printed and process.stderr is not None:
-                for line in process.stderr:
-                    if line := line.strip():
-                        if line.startswith("Progress"):
-                            starts_w_progress = True
-                        elif starts_w_progress:
-                            starts_w_progress = False
-                            print()
-                        _print(
-                            f" | {line}",
-                            indent=indent,
-                            color=Color.DIM,
-                            end="\r" if starts_w_progress else "\n",
-                        )
         else:
             return_code = process.wait()
 
     except Exception as e:  # noqa: BLE001
         print(e.__class__.__name__, e)
-        perr(f"Failed to run command `{cmd}`: {e}", indent=indent)
+        perr(f"Failed to run command `{shlex.join(args)}`: {e}", indent=indent)
         return False
 
     else:
@@ -218,19 +309,11 @@ def install_mkcert() -> bool:
 
     pinfo("Installing mkcert...", indent=2)
 
-    install_cmds = {
-        "brew": "brew install mkcert",
-        "choco": "choco install mkcert -y",
-        "scoop": "scoop install mkcert",
-        "apt": "sudo apt update && sudo apt install -y mkcert",
-        "dnf": "sudo dnf install -y mkcert",
-        "pacman": "sudo pacman -S mkcert",
-    }
-
-    for pm, cmd in install_cmds.items():
-        if which(pm):
+    tools = tool_paths()
+    for pm, cmds in MKCERT_INSTALL_CMDS.items():
+        if tools[pm]:
             pinfo(f"Installing via {pm}", indent=4)
-            if run_cmd(cmd, indent=6):
+            if all(run_cmd(cmd, indent=6) for cmd in cmds):
                 psuccess("mkcert installed successfully", indent=4)
                 return True
 
@@ -242,6 +325,52 @@ def install_mkcert() -> bool:
     return False
 
 
+def mkcert_ca_found() -> bool:
+    """Check for mkcert's root CA files (same CAROOT lookup as `mkcert -CAROOT`)
+
+    The files existing does not mean the CA is in the system trust store.
+    """
+
+    if caroot := getenv("CAROOT"):
+        ca_dir = Path(caroot)
+    else:
+        if _IS_WINDOWS:
+            data_dir = Path(getenv("LOCALAPPDATA", ""))
+        elif xdg_data_home := getenv("XDG_DATA_HOME"):
+            data_dir = Path(xdg_data_home)
+        elif _SYSTEM == "Darwin":
+            data_dir = Path.home() / "Library" / "Application Support"
+        else:
+            data_dir = Path.home() / ".local" / "share"
+        ca_dir = data_dir / "mkcert"
+
+    try:
+        with scandir(ca_dir) as entries:
+            return {"rootCA.pem", "rootCA-key.pem"} <= {entry.name for entry in entries}
+    except OSError:
+        return False
+
+
+def preflight() -> list[str]:
+    """Check for every required tool/file up front. Returns descriptions of missing items."""
+
+    tools = tool_paths()
+    missing = []
+
+    if not (ROOT_DIR / "package.json").exists():
+        missing.append("Missing required `package.json` file")
+    if not (ROOT_DIR / ".env").exists() and not (ROOT_DIR / ".env.example").exists():
+        missing.append("Missing `.env.example` file. Cannot create `.env`")
+    if not tools["node"]:
+        missing.append("Node.js is not installed (https://nodejs.org)")
+    if not tools["npm"]:
+        missing.append("npm is not installed (https://docs.npmjs.com/downloading-and-installing-node-js-and-npm)")
+    if not tools["mkcert"] and not any(tools[pm] for pm in MKCERT_INSTALL_CMDS):
+        missing.append("mkcert is not installed and no supported package manager was found to install it")
+
+    return missing
+
+
 def check_pwd() -> None:
     """Check and set cwd to root directory"""
 
@@ -249,7 +378,12 @@ def check_pwd() -> None:
     cwd = Path.cwd()
     pinfo(f"Current dir: `{cwd}`", indent=2)
 
-    if Path(ROOT_DIR) != cwd:
+    try:
+        same_dir = ROOT_DIR.samefile(cwd)
+    except OSError:
+        same_dir = False
+
+    if not same_dir:
         pwarn("Current dir is not the root directory", indent=2)
         pinfo(f"Changing root dir: `{ROOT_DIR}`", indent=2)
         chdir(ROOT_DIR)
@@ -263,48 +397,40 @@ def check_env() -> None:
     psec("Environment")
     env_file = Path(".env")
 
-    if env_file.exists():
-        with env_file.open(encoding="utf-8") as f:
-            err = False
-            for line in f:
-                if line.startswith("#") or not line.strip():
-                    continue
-                if "=" not in line:
-                    err = True
-                    perr(f"Invalid line in `.env`: {line.strip()}", indent=2)
-                    continue
-                key, val = line.split("=", 1)
-                if key.strip() not in ENV_KEYS:
-                    err = True
-                    perr(
-                        f"Unknown key in `.env`: {key} (expected one of {', '.join(ENV_KEYS)})",
-                        indent=2,
-                    )
-                    continue
-                if not val.strip():
-                    err = True
-                    perr(f"Empty value for key `.env`: {key}", indent=2)
-                    continue
-
-        if err:
-            sys.exit(2)
-
-        psuccess("`.env` is valid", indent=2)
-
-    else:
+    try:
+        text = env_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
         pwarn("No `.env` file found.", indent=2)
 
-        if not Path(".env.example").exists():
+        try:
+            env_content = Path(".env.example").read_text(encoding="utf-8")
+        except FileNotFoundError:
             perr("Missing `.env.example` file. Cannot create `.env`", indent=2)
             sys.exit(2)
 
-        env_content = Path(".env.example").read_text(encoding="utf-8")
         env_file.write_text(env_content[env_content.find("\n") + 1 :], encoding="utf-8")
 
         pinfo("Created `.env` from `.env.example`", indent=2)
         perr("Missing required values in `.env` (contact darragh0)", indent=2)
         sys.exit(2)
 
+    errors = [f"Invalid line in `.env`: {line.strip()}" for line in _ENV_INVALID_RE.findall(text)]
+    entries = {m[1]: m[2] for m in _ENV_ENTRY_RE.finditer(text)}
+    expected = ", ".join(sorted(ENV_KEYS))
+
+    errors += [
+        f"Unknown key in `.env`: {key} (expected one of {expected})" for key in sorted(entries.keys() - ENV_KEYS)
+    ]
+    errors += [f"Missing key in `.env`: {key}" for key in sorted(ENV_KEYS - entries.keys())]
+    errors += [f"Empty value for key `.env`: {key}" for key, val in entries.items() if key in ENV_KEYS and not val]
+
+    for error in errors:
+        perr(error, indent=2)
+    if errors:
+        sys.exit(2)
+
+    psuccess("`.env` is valid", indent=2)
+
 
 def check_certs() -> None:
     """Check/install certificates"""
@@ -312,11 +438,19 @@ def check_certs() -> None:
     psec("Certificates")
     certs_dir = ROOT_DIR / "certs"
 
-    if not certs_dir.exists():
-        Path("certs").mkdir(parents=True, exist_ok=True)
-        pinfo("Created `certs` dir", indent=2)
+    try:
+        try:
+            with scandir(certs_dir) as entries:
+                cert_files = {entry.name for entry in entries}
+        except FileNotFoundError:
+            certs_dir.mkdir(parents=True, exist_ok=True)
+            cert_files = set()
+            pinfo("Created `certs` dir", indent=2)
+    except OSError as e:
+        perr(f"Cannot access `certs` dir: {e}", indent=2)
+        sys.exit(3)
 
-    if not which("mkcert"):
+    if not tool_paths()["mkcert"]:
         perr("mkcert is not installed", indent=2)
         install = yn_prompt("Install mkcert?", indent=2)
         if not install:
@@ -333,20 +467,22 @@ def check_certs() -> None:
     else:
         psuccess("mkcert is installed", indent=2)
 
-    pinfo("Installing local CA", indent=2)
-    if not run_cmd("mkcert -install", indent=4):
-        perr("Failed to install local CA", indent=2)
-        sys.exit(3)
+    # `-install` rides along with cert generation (same mkcert process); only skipped when fully provisioned
+    cmd = ["mkcert"]
 
-    both_files_exist = Path(certs_dir / "localhost-key.pem").exists() and Path(certs_dir / "localhost.pem").exists()
-    if not both_files_exist:
+    if not {"localhost-key.pem", "localhost.pem"} <= cert_files:
+        pinfo("Installing local CA", indent=2)
         pinfo("Generating certificates", indent=2)
-        if not run_cmd(
-            "mkcert -key-file certs/localhost-key.pem -cert-file certs/localhost.pem localhost",
-            indent=4,
-        ):
-            perr("Failed to generate certificates", indent=2)
-            sys.exit(3)
+        cmd += ["-install", "-key-file", "certs/localhost-key.pem", "-cert-file", "certs/localhost.pem", "localhost"]
+    elif not mkcert_ca_found():
+        pinfo("Installing local CA", indent=2)
+        cmd.append("-install")
+    else:
+        psuccess("Local CA found", indent=2)
+
+    if len(cmd) > 1 and not run_cmd(cmd, indent=4):
+        perr("Failed to install local CA or generate certificates", indent=2)
+        sys.exit(3)
 
     psuccess("Certificates are valid", indent=2)
 
@@ -356,16 +492,6 @@ def check_nodejs() -> None:
 
     psec("Dependencies")
 
-    if not Path("package.json").exists():
-        perr("Missing required `package.json` file", indent=2)
-        sys.exit(4)
-
-    nodejs = which("node")
-    if not nodejs:
-        perr("Node.js is not installed", indent=2)
-        perr("Please install it to continue (https://nodejs.org)", indent=2)
-        sys.exit(4)
-
     pinfo("Installing dependencies", indent=2)
     if not run_cmd("npm install", indent=4):
         perr("Failed to install npm dependencies", indent=2)
@@ -386,20 +512,24 @@ def compile_scss() -> None:
 
 
 def main() -> None:
-    Color.check_platform()
+    check_platform()
 
-    win = False
-    if platform.system() == "Windows" and not is_admin():
+    if _IS_WINDOWS and not is_admin():
         perr("This script requires administrator privileges on Windows")
         perr("Please run again as admin")
         print()
         pinfo("Tip: Run the following in Powershell if wt.exe is available: ")
         pwindows_tip()
         sys.exit(1)
-    elif platform.system() == "Windows":
-        win = True
 
     pbanner()
+
+    if missing := preflight():
+        psec("Preflight")
+        for item in missing:
+            perr(item, indent=2)
+        sys.exit(2)
+
     check_pwd()
     check_env()
     check_certs()
@@ -408,7 +538,7 @@ def main() -> None:
 
     print()
     pinfo("Run `npm run serve` to start the server")
-    if win:
+    if _IS_WINDOWS:
         print()
         sp.run("pause", shell=True, check=False)  # noqa: S602, S607
 